@@ -9,9 +9,10 @@ from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
 
-from .const import DOMAIN
+from .const import CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL, DOMAIN
 from .coordinator import HakunaDataUpdateCoordinator
 from .api import HakunaApiClient
+from .entity import get_device_info
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -32,14 +33,19 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     coordinator = HakunaDataUpdateCoordinator(
         hass,
         api_client=api_client,
-        update_interval=timedelta(minutes=entry.options.get("scan_interval", 5)),
+        update_interval=timedelta(
+            minutes=entry.options.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL)
+        ),
     )
 
     await coordinator.async_config_entry_first_refresh()
 
+    entry.async_on_unload(get_device_info.cache_clear)
+
     hass.data[DOMAIN][entry.entry_id] = {
         "coordinator": coordinator,
         "api_client": api_client,
+        "prev_options": dict(entry.options),
     }
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
@@ -59,5 +65,28 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
 async def async_reload_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
     """Reload config entry."""
-    await async_unload_entry(hass, entry)
-    await async_setup_entry(hass, entry)
+    entry_data = hass.data[DOMAIN].get(entry.entry_id)
+    if entry_data is not None:
+        prev_options = entry_data["prev_options"]
+        new_options = dict(entry.options)
+        changed = {
+            key
+            for key in prev_options.keys() | new_options.keys()
+            if prev_options.get(key) != new_options.get(key)
+        }
+        if changed == {CONF_SCAN_INTERVAL}:
+            # Only the scan interval changed: apply it without refetching
+            coordinator: HakunaDataUpdateCoordinator = entry_data["coordinator"]
+            coordinator.update_interval = timedelta(
+                minutes=new_options.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL)
+            )
+            if coordinator.last_update_success:
+                # Reschedule the next refresh with the new interval
+                coordinator.async_set_updated_data(coordinator.data)
+            else:
+                # Don't mark a failing coordinator as successful
+                await coordinator.async_request_refresh()
+            entry_data["prev_options"] = new_options
+            return
+
+    await hass.config_entries.async_reload(entry.entry_id)
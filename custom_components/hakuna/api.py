@@ -1,16 +1,48 @@
 """API client for Hakuna Time Tracking."""
 from __future__ import annotations
 
+import asyncio
 import logging
-from datetime import date, datetime
+import time
+from datetime import date, datetime, timedelta
 from typing import Any
 
 import aiohttp
 
-from .const import API_BASE_URL
+from homeassistant.util.json import json_loads
+
+from .const import (
+    API_BASE_URL,
+    DEFAULT_MAX_CONCURRENT_REQUESTS,
+    DEFAULT_OPEN_ENTRIES_CACHE_TTL,
+    DEFAULT_RATE_LIMIT,
+    DEFAULT_RATE_LIMIT_BURST,
+    TIMER_SNAPSHOT_TTL,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
+# Static endpoints, resolved to full URLs once at import
+KNOWN_ENDPOINTS = (
+    "/timer",
+    "/overview",
+    "/time_entries",
+    "/absences",
+    "/users",
+    "/presence",
+    "/projects",
+    "/tasks",
+    "/company",
+    "/absence_types",
+    "/ping",
+)
+_URL_CACHE = {endpoint: f"{API_BASE_URL}{endpoint}" for endpoint in KNOWN_ENDPOINTS}
+
+# Rarely changing catalog endpoints fetched with If-None-Match
+_CONDITIONAL_URLS = frozenset(
+    _URL_CACHE[endpoint] for endpoint in ("/projects", "/tasks", "/absence_types")
+)
+
 
 class HakunaApiError(Exception):
     """Exception for Hakuna API errors."""
@@ -24,6 +56,45 @@ class HakunaRateLimitError(HakunaApiError):
     """Exception for rate limit errors."""
 
 
+def _iso(value: date | str) -> str:
+    """Return an ISO date string for a date or pass a string through."""
+    return value.isoformat() if isinstance(value, date) else value
+
+
+class _TokenBucket:
+    """Client-side token bucket to pace requests below the API rate limit.
+
+    Only used from the event loop, so no locking is needed.
+    """
+
+    def __init__(self, rate: float, capacity: float) -> None:
+        """Initialize the bucket full."""
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.tokens = min(
+            self.capacity, self.tokens + (now - self.updated) * self.rate
+        )
+        self.updated = now
+
+    async def acquire(self) -> None:
+        """Wait until a token is available and take it."""
+        self._refill()
+        while self.tokens < 1:
+            await asyncio.sleep((1 - self.tokens) / self.rate)
+            self._refill()
+        self.tokens -= 1
+
+    def penalize(self, seconds: float) -> None:
+        """Drain the bucket so no request is sent for the given time."""
+        self._refill()
+        self.tokens = min(self.tokens, -seconds * self.rate)
+
+
 class HakunaApiClient:
     """API client for Hakuna."""
 
@@ -32,11 +103,27 @@ class HakunaApiClient:
         session: aiohttp.ClientSession,
         api_token: str,
         company: str | None = None,
+        open_entries_ttl: float = DEFAULT_OPEN_ENTRIES_CACHE_TTL,
+        max_concurrent_requests: int = DEFAULT_MAX_CONCURRENT_REQUESTS,
     ) -> None:
         """Initialize the API client."""
         self._session = session
         self._api_token = api_token
         self._company = company
+        self._open_entries_ttl = open_entries_ttl
+        # (timestamp, (older_than_days, today), users_with_issues)
+        self._open_entries_cache: tuple[
+            float, tuple[int, date], list[dict[str, Any]]
+        ] | None = None
+        # Bounds per-user fan-out so we stay within the API rate limit
+        self._semaphore = asyncio.Semaphore(max_concurrent_requests)
+        # Last ETag and parsed body per catalog URL, for conditional requests
+        self._etag_cache: dict[str, tuple[str, list[Any]]] = {}
+        # (timestamp, timer_running) from the last timer call
+        self._last_timer_snapshot: tuple[float, bool] | None = None
+        self._bucket = _TokenBucket(
+            rate=DEFAULT_RATE_LIMIT, capacity=DEFAULT_RATE_LIMIT_BURST
+        )
         self._headers = {
             "X-Auth-Token": api_token,
             "Accept-Version": "v1",
@@ -51,13 +138,34 @@ class HakunaApiClient:
         json_data: dict[str, Any] | None = None,
     ) -> dict[str, Any] | list[Any] | None:
         """Make a request to the API."""
-        url = f"{API_BASE_URL}{endpoint}"
+        url = _URL_CACHE.get(endpoint) or f"{API_BASE_URL}{endpoint}"
+        return await self._send(method, url, params, json_data)
+
+    async def _send(
+        self,
+        method: str,
+        url: str,
+        params: dict[str, Any] | None = None,
+        json_data: dict[str, Any] | None = None,
+    ) -> dict[str, Any] | list[Any] | None:
+        """Send a request to a fully resolved API URL.
+
+        Endpoint methods with a static path call this directly with the
+        precomputed URL, skipping the endpoint lookup in _request.
+        """
+        headers = self._headers
+        conditional = method == "GET" and url in _CONDITIONAL_URLS and not params
+        cached = self._etag_cache.get(url) if conditional else None
+        if cached is not None:
+            headers = {**self._headers, "If-None-Match": cached[0]}
+
+        await self._bucket.acquire()
 
         try:
             async with self._session.request(
                 method,
                 url,
-                headers=self._headers,
+                headers=headers,
                 params=params,
                 json=json_data,
             ) as response:
@@ -65,9 +173,16 @@ class HakunaApiClient:
                     raise HakunaAuthError("Invalid API token")
                 if response.status == 429:
                     retry_after = response.headers.get("Retry-After", "unknown")
+                    try:
+                        self._bucket.penalize(float(retry_after))
+                    except ValueError:
+                        pass
                     raise HakunaRateLimitError(
                         f"Rate limit exceeded. Retry after {retry_after} seconds"
                     )
+                if response.status == 304 and cached is not None:
+                    # Copy so callers can't modify the cached list
+                    return list(cached[1])
                 if response.status == 404:
                     # Timer not running returns 404
                     return None
@@ -80,10 +195,22 @@ class HakunaApiClient:
                 if response.status == 204:
                     return None
 
-                return await response.json()
+                raw = await response.read()
+                result = json_loads(raw) if raw else None
+
+                if conditional:
+                    etag = response.headers.get("ETag")
+                    if etag and isinstance(result, list):
+                        self._etag_cache[url] = (etag, list(result))
+                    else:
+                        self._etag_cache.pop(url, None)
+
+                return result
 
         except aiohttp.ClientError as err:
             raise HakunaApiError(f"Connection error: {err}") from err
+        except ValueError as err:
+            raise HakunaApiError(f"Invalid JSON response: {err}") from err
 
     # ==================== Timer Endpoints ====================
 
@@ -103,10 +230,11 @@ class HakunaApiClient:
             "project": {...}
         }
         """
-        result = await self._request("GET", "/timer")
+        result = await self._send("GET", _URL_CACHE["/timer"])
         # API returns 200 with date=null when no timer is running
         if result and result.get("date") is None:
-            return None
+            result = None
+        self._set_timer_snapshot(result is not None)
         return result
 
     async def start_timer(
@@ -124,15 +252,30 @@ class HakunaApiClient:
         if note is not None:
             data["note"] = note
 
-        return await self._request("POST", "/timer", json_data=data if data else None)
+        self._open_entries_cache = None
+        self._last_timer_snapshot = None
+        result = await self._send("POST", _URL_CACHE["/timer"], json_data=data if data else None)
+        self._set_timer_snapshot(True)
+        return result
 
     async def stop_timer(self) -> dict[str, Any]:
         """Stop the running timer and create a time entry."""
-        return await self._request("PUT", "/timer")
+        self._open_entries_cache = None
+        self._last_timer_snapshot = None
+        result = await self._send("PUT", _URL_CACHE["/timer"])
+        self._set_timer_snapshot(False)
+        return result
 
     async def cancel_timer(self) -> None:
         """Cancel/delete the running timer without creating a time entry."""
-        await self._request("DELETE", "/timer")
+        self._open_entries_cache = None
+        self._last_timer_snapshot = None
+        await self._send("DELETE", _URL_CACHE["/timer"])
+        self._set_timer_snapshot(False)
+
+    def _set_timer_snapshot(self, running: bool) -> None:
+        """Remember the latest known timer state."""
+        self._last_timer_snapshot = (time.monotonic(), running)
 
     # ==================== Overview Endpoint ====================
 
@@ -152,7 +295,7 @@ class HakunaApiClient:
         params = {}
         if user_id is not None:
             params["user_id"] = user_id
-        return await self._request("GET", "/overview", params=params if params else None)
+        return await self._send("GET", _URL_CACHE["/overview"], params=params if params else None)
 
     # ==================== Time Entries Endpoints ====================
 
@@ -163,22 +306,24 @@ class HakunaApiClient:
         user_id: int | None = None,
     ) -> list[dict[str, Any]]:
         """Get time entries for a date range."""
-        if isinstance(start_date, date):
-            start_date = start_date.isoformat()
-        if end_date is None:
-            end_date = start_date
-        elif isinstance(end_date, date):
-            end_date = end_date.isoformat()
-
-        params = {
-            "start_date": start_date,
-            "end_date": end_date,
+        start_iso = _iso(start_date)
+        end_iso = start_iso if end_date is None else _iso(end_date)
+
+        params: dict[str, Any] = {
+            "start_date": start_iso,
+            "end_date": end_iso,
         }
         if user_id is not None:
             params["user_id"] = user_id
 
-        result = await self._request("GET", "/time_entries", params=params)
-        return result if result else []
+        return await self._get_time_entries_params(params)
+
+    async def _get_time_entries_params(
+        self, params: dict[str, Any]
+    ) -> list[dict[str, Any]]:
+        """Get time entries for already normalized query parameters."""
+        result = await self._send("GET", _URL_CACHE["/time_entries"], params=params)
+        return result if isinstance(result, list) else []
 
     async def get_time_entry(self, entry_id: int) -> dict[str, Any]:
         """Get a single time entry by ID."""
@@ -198,15 +343,15 @@ class HakunaApiClient:
         if user_id is not None:
             params["user_id"] = user_id
 
-        result = await self._request("GET", "/absences", params=params)
-        return result if result else []
+        result = await self._send("GET", _URL_CACHE["/absences"], params=params)
+        return result if isinstance(result, list) else []
 
     # ==================== Users & Presence Endpoints ====================
 
     async def get_users(self) -> list[dict[str, Any]]:
         """Get list of users you can manage."""
-        result = await self._request("GET", "/users")
-        return result if result else []
+        result = await self._send("GET", _URL_CACHE["/users"])
+        return result if isinstance(result, list) else []
 
     async def get_presence(self) -> list[dict[str, Any]]:
         """Get today's presence/absence information for all users.
@@ -222,42 +367,50 @@ class HakunaApiClient:
             ...
         ]
         """
-        result = await self._request("GET", "/presence")
-        return result if result else []
+        result = await self._send("GET", _URL_CACHE["/presence"])
+        return result if isinstance(result, list) else []
 
     # ==================== Projects & Tasks Endpoints ====================
 
     async def get_projects(self) -> list[dict[str, Any]]:
         """Get list of all projects."""
-        result = await self._request("GET", "/projects")
-        return result if result else []
+        result = await self._send("GET", _URL_CACHE["/projects"])
+        return result if isinstance(result, list) else []
 
     async def get_tasks(self) -> list[dict[str, Any]]:
         """Get list of all tasks."""
-        result = await self._request("GET", "/tasks")
-        return result if result else []
+        result = await self._send("GET", _URL_CACHE["/tasks"])
+        return result if isinstance(result, list) else []
 
     # ==================== Company Info ====================
 
     async def get_company(self) -> dict[str, Any]:
         """Get company information."""
-        return await self._request("GET", "/company")
+        return await self._send("GET", _URL_CACHE["/company"])
 
     async def get_absence_types(self) -> list[dict[str, Any]]:
         """Get list of absence types."""
-        result = await self._request("GET", "/absence_types")
-        return result if result else []
+        result = await self._send("GET", _URL_CACHE["/absence_types"])
+        return result if isinstance(result, list) else []
 
     # ==================== Ping / Health Check ====================
 
     async def ping(self) -> dict[str, Any]:
         """Ping the API to check connectivity."""
-        return await self._request("GET", "/ping")
+        return await self._send("GET", _URL_CACHE["/ping"])
 
     # ==================== Helper Methods ====================
 
     async def is_timer_running(self) -> bool:
-        """Check if a timer is currently running."""
+        """Check if a timer is currently running.
+
+        Uses the state from the last timer call if it is recent enough.
+        """
+        if self._last_timer_snapshot is not None:
+            snapshot_at, running = self._last_timer_snapshot
+            if time.monotonic() - snapshot_at < TIMER_SNAPSHOT_TTL:
+                return running
+
         timer = await self.get_timer()
         return timer is not None
 
@@ -307,28 +460,64 @@ class HakunaApiClient:
         """Get users with time entries older than specified days without end time.
         
         This requires supervisor/admin permissions.
+        Results are cached for a short time to avoid one request per user
+        on every call.
         """
+        cache_key = (older_than_days, date.today())
+        if self._open_entries_cache is not None:
+            cached_at, cached_key, cached = self._open_entries_cache
+            if (
+                cached_key == cache_key
+                and time.monotonic() - cached_at < self._open_entries_ttl
+            ):
+                # Copy so callers can't modify the cached list
+                return list(cached)
+
         users_with_issues = []
         
         try:
             users = await self.get_users()
             
-            from datetime import timedelta
             cutoff_date = date.today() - timedelta(days=older_than_days)
             start_date = cutoff_date - timedelta(days=30)  # Look back 30 days
+            cutoff_iso = cutoff_date.isoformat()
+            base_params = {
+                "start_date": start_date.isoformat(),
+                "end_date": cutoff_iso,
+            }
             
-            for user in users:
-                user_id = user.get("id")
-                entries = await self.get_time_entries(
-                    start_date=start_date,
-                    end_date=cutoff_date,
-                    user_id=user_id,
-                )
-                
+            async def fetch(
+                user: dict[str, Any],
+            ) -> tuple[dict[str, Any], list[dict[str, Any]]]:
+                async with self._semaphore:
+                    user_id = user.get("id")
+                    params = (
+                        {**base_params, "user_id": user_id}
+                        if user_id is not None
+                        else base_params
+                    )
+                    return user, await self._get_time_entries_params(params)
+
+            results = await asyncio.gather(
+                *(fetch(user) for user in users), return_exceptions=True
+            )
+
+            failed = False
+            for result in results:
+                if isinstance(result, HakunaApiError):
+                    _LOGGER.warning(
+                        "Could not check time entries for a user: %s", result
+                    )
+                    failed = True
+                    continue
+                if isinstance(result, BaseException):
+                    raise result
+
+                user, entries = result
                 # Check for entries without proper end time or duration issues
                 for entry in entries:
                     entry_date = entry.get("date")
-                    if entry_date and entry_date < cutoff_date.isoformat():
+                    if entry_date and entry_date < cutoff_iso:
                         # Entry is older than cutoff
                         if entry.get("duration_in_seconds", 0) == 0:
                             users_with_issues.append({
@@ -337,6 +526,14 @@ class HakunaApiClient:
                                 "issue": "zero_duration",
                             })
                             break
+
+            # Don't cache incomplete results
+            if failed:
+                return users_with_issues
+
+            self._open_entries_cache = (
+                time.monotonic(), cache_key, list(users_with_issues)
+            )
                             
         except HakunaApiError as err:
             _LOGGER.warning("Could not check for open time entries: %s", err)
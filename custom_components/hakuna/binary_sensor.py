@@ -10,15 +10,16 @@ from homeassistant.components.binary_sensor import (
 )
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
+from .api import HakunaApiError
 from .const import DOMAIN
 from .coordinator import HakunaDataUpdateCoordinator
+from .entity import EMPTY_DICT, CachedAttributesMixin, get_device_info
 
 
-BINARY_SENSOR_DESCRIPTIONS = [
+BINARY_SENSOR_DESCRIPTIONS = (
     BinarySensorEntityDescription(
         key="timer_running",
         name="Eingestempelt",
@@ -31,7 +32,7 @@ BINARY_SENSOR_DESCRIPTIONS = [
         icon="mdi:calendar-remove",
         device_class=BinarySensorDeviceClass.OCCUPANCY,
     ),
-]
+)
 
 
 async def async_setup_entry(
@@ -48,18 +49,26 @@ async def async_setup_entry(
     ]
 
     # Add binary sensors for team members if presence data is available
-    if coordinator.data and coordinator.data.get("presence"):
-        for member in coordinator.data["presence"]:
-            user = member.get("user", {})
-            if user.get("id") and user.get("name"):
-                entities.append(
-                    HakunaTeamMemberSensor(coordinator, entry, user)
-                )
+    try:
+        presence = await coordinator.async_get_presence()
+    except HakunaApiError:
+        presence = []
+
+    for member in presence:
+        user = member.get("user", {})
+        if user.get("id") and user.get("name"):
+            entities.append(
+                HakunaTeamMemberSensor(coordinator, entry, user)
+            )
 
     async_add_entities(entities)
 
 
-class HakunaBinarySensor(CoordinatorEntity[HakunaDataUpdateCoordinator], BinarySensorEntity):
+class HakunaBinarySensor(
+    CachedAttributesMixin,
+    CoordinatorEntity[HakunaDataUpdateCoordinator],
+    BinarySensorEntity,
+):
     """Representation of a Hakuna binary sensor."""
 
     _attr_has_entity_name = True
@@ -73,14 +82,8 @@ class HakunaBinarySensor(CoordinatorEntity[HakunaDataUpdateCoordinator], BinaryS
         """Initialize the binary sensor."""
         super().__init__(coordinator)
         self.entity_description = description
-        self._attr_unique_id = f"{entry.entry_id}_{description.key}"
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, entry.entry_id)},
-            name="Hakuna",
-            manufacturer="Hakuna AG",
-            model="Time Tracking",
-            entry_type="service",
-        )
+        self._attr_unique_id = entry.entry_id + "_" + description.key
+        self._attr_device_info = get_device_info(entry.entry_id)
 
     @property
     def is_on(self) -> bool | None:
@@ -94,14 +97,13 @@ class HakunaBinarySensor(CoordinatorEntity[HakunaDataUpdateCoordinator], BinaryS
         if key == "timer_running":
             return data.get("timer_running", False)
         elif key == "absent_today":
-            absence = data.get("absence_today", {})
+            absence = data.get("absence_today") or EMPTY_DICT
             return absence.get("absent", False)
 
         return None
 
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        """Return extra attributes."""
+    def _build_extra_state_attributes(self) -> dict[str, Any]:
+        """Build extra attributes from the current coordinator data."""
         attrs = {}
 
         if self.coordinator.data is None:
@@ -114,30 +116,34 @@ class HakunaBinarySensor(CoordinatorEntity[HakunaDataUpdateCoordinator], BinaryS
             timer = data.get("timer")
 
             if timer:
-                attrs["start_time"] = timer.get("start_time")
-                attrs["duration"] = timer.get("duration")
-                attrs["duration_seconds"] = timer.get("duration_in_seconds")
-                attrs["note"] = timer.get("note")
-                attrs["date"] = timer.get("date")
-
-                if timer.get("task"):
-                    attrs["task"] = timer["task"].get("name")
-                    attrs["task_id"] = timer["task"].get("id")
-
-                if timer.get("project"):
-                    project = timer["project"]
+                task = timer.get("task")
+                project = timer.get("project")
+                user = timer.get("user")
+                attrs = {
+                    "start_time": timer.get("start_time"),
+                    "duration": timer.get("duration"),
+                    "duration_seconds": timer.get("duration_in_seconds"),
+                    "note": timer.get("note"),
+                    "date": timer.get("date"),
+                }
+
+                if task:
+                    attrs["task"] = task.get("name")
+                    attrs["task_id"] = task.get("id")
+
+                if project:
                     if isinstance(project, dict):
                         attrs["project"] = project.get("name")
                         attrs["project_id"] = project.get("id")
                     else:
                         attrs["project_id"] = project
 
-                if timer.get("user"):
-                    attrs["user_name"] = timer["user"].get("name")
-                    attrs["user_id"] = timer["user"].get("id")
+                if user:
+                    attrs["user_name"] = user.get("name")
+                    attrs["user_id"] = user.get("id")
 
         elif key == "absent_today":
-            absence = data.get("absence_today", {})
+            absence = data.get("absence_today") or EMPTY_DICT
             if absence.get("absent"):
                 attrs["absence_type"] = absence.get("type")
                 attrs["is_vacation"] = absence.get("is_vacation")
@@ -149,7 +155,11 @@ class HakunaBinarySensor(CoordinatorEntity[HakunaDataUpdateCoordinator], BinaryS
         return attrs
 
 
-class HakunaTeamMemberSensor(CoordinatorEntity[HakunaDataUpdateCoordinator], BinarySensorEntity):
+class HakunaTeamMemberSensor(
+    CachedAttributesMixin,
+    CoordinatorEntity[HakunaDataUpdateCoordinator],
+    BinarySensorEntity,
+):
     """Representation of a team member presence sensor."""
 
     _attr_has_entity_name = True
@@ -170,33 +180,31 @@ class HakunaTeamMemberSensor(CoordinatorEntity[HakunaDataUpdateCoordinator], Bin
         self._attr_name = f"{self._user_name} anwesend"
         self._attr_icon = "mdi:account-clock"
         self._attr_device_class = BinarySensorDeviceClass.PRESENCE
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, entry.entry_id)},
-            name="Hakuna",
-            manufacturer="Hakuna AG",
-            model="Time Tracking",
-            entry_type="service",
-        )
+        self._attr_device_info = get_device_info(entry.entry_id)
         self._attr_entity_registry_enabled_default = False
 
+    async def async_added_to_hass(self) -> None:
+        """Register as a presence consumer when added."""
+        await super().async_added_to_hass()
+        self.async_on_remove(self.coordinator.async_add_presence_consumer())
+
     @property
     def is_on(self) -> bool | None:
         """Return true if the team member has a timer running."""
         if self.coordinator.data is None:
             return None
 
-        presence = self.coordinator.data.get("presence", [])
-        
-        for member in presence:
-            user = member.get("user", {})
-            if user.get("id") == self._user_id:
-                return member.get("has_timer_running", False)
+        presence_by_user_id = (
+            self.coordinator.data.get("presence_by_user_id") or EMPTY_DICT
+        )
+        member = presence_by_user_id.get(self._user_id)
+        if member is None:
+            return None
 
-        return None
+        return member.get("has_timer_running", False)
 
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        """Return extra attributes."""
+    def _build_extra_state_attributes(self) -> dict[str, Any]:
+        """Build extra attributes from the current coordinator data."""
         attrs = {
             "user_id": self._user_id,
             "user_name": self._user_name,
@@ -205,15 +213,15 @@ class HakunaTeamMemberSensor(CoordinatorEntity[HakunaDataUpdateCoordinator], Bin
         if self.coordinator.data is None:
             return attrs
 
-        presence = self.coordinator.data.get("presence", [])
-        
-        for member in presence:
-            user = member.get("user", {})
-            if user.get("id") == self._user_id:
-                attrs["absent_first_half_day"] = member.get("absent_first_half_day")
-                attrs["absent_second_half_day"] = member.get("absent_second_half_day")
-                attrs["groups"] = user.get("groups", [])
-                attrs["status"] = user.get("status")
-                break
+        presence_by_user_id = (
+            self.coordinator.data.get("presence_by_user_id") or EMPTY_DICT
+        )
+        member = presence_by_user_id.get(self._user_id)
+        if member is not None:
+            user = member.get("user") or EMPTY_DICT
+            attrs["absent_first_half_day"] = member.get("absent_first_half_day")
+            attrs["absent_second_half_day"] = member.get("absent_second_half_day")
+            attrs["groups"] = user.get("groups", [])
+            attrs["status"] = user.get("status")
 
         return attrs
@@ -7,18 +7,18 @@ from typing import Any
 from homeassistant.components.button import ButtonEntity, ButtonEntityDescription
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import DOMAIN
 from .coordinator import HakunaDataUpdateCoordinator
+from .entity import get_device_info
 from .api import HakunaApiClient
 
 _LOGGER = logging.getLogger(__name__)
 
 
-BUTTON_DESCRIPTIONS = [
+BUTTON_DESCRIPTIONS = (
     ButtonEntityDescription(
         key="start_timer",
         name="Timer starten",
@@ -39,7 +39,7 @@ BUTTON_DESCRIPTIONS = [
         name="Daten aktualisieren",
         icon="mdi:refresh",
     ),
-]
+)
 
 
 async def async_setup_entry(
@@ -75,14 +75,8 @@ class HakunaButton(CoordinatorEntity[HakunaDataUpdateCoordinator], ButtonEntity)
         super().__init__(coordinator)
         self.entity_description = description
         self._api_client = api_client
-        self._attr_unique_id = f"{entry.entry_id}_{description.key}"
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, entry.entry_id)},
-            name="Hakuna",
-            manufacturer="Hakuna AG",
-            model="Time Tracking",
-            entry_type="service",
-        )
+        self._attr_unique_id = entry.entry_id + "_" + description.key
+        self._attr_device_info = get_device_info(entry.entry_id)
 
     @property
     def available(self) -> bool:
@@ -1,6 +1,7 @@
 """Config flow for Hakuna integration."""
 from __future__ import annotations
 
+import hashlib
 import logging
 from typing import Any
 
@@ -40,6 +41,13 @@ class HakunaConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 session=session,
                 api_token=user_input[CONF_API_TOKEN],
             )
+            # Stable across restarts, unlike the builtin hash()
+            token_hash = int.from_bytes(
+                hashlib.blake2b(
+                    user_input[CONF_API_TOKEN].encode(), digest_size=5
+                ).digest(),
+                "big",
+            )
 
             try:
                 # Test the connection by getting overview
@@ -64,7 +72,6 @@ class HakunaConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                         tasks = await api_client.get_tasks()
                         # Tasks endpoint works, use token hash as ID
                         if tasks:
-                            token_hash = abs(hash(user_input[CONF_API_TOKEN])) % (10**8)
                             user_id = token_hash
                     except HakunaApiError:
                         pass
@@ -84,7 +91,6 @@ class HakunaConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                     )
 
                 # Fallback: use token hash as unique ID
-                token_hash = abs(hash(user_input[CONF_API_TOKEN])) % (10**8)
                 await self.async_set_unique_id(f"hakuna_{token_hash}")
                 self._abort_if_unique_id_configured()
 
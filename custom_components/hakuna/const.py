@@ -12,6 +12,13 @@ CONF_SCAN_INTERVAL = "scan_interval"
 
 # Default values
 DEFAULT_SCAN_INTERVAL = 5  # minutes
+DEFAULT_OPEN_ENTRIES_CACHE_TTL = 600  # seconds
+DEFAULT_MAX_CONCURRENT_REQUESTS = 8
+DEFAULT_RATE_LIMIT = 5  # requests per second
+DEFAULT_RATE_LIMIT_BURST = 10
+TIMER_SNAPSHOT_TTL = 30  # seconds
+TASKS_CACHE_TTL = 3600  # seconds
+PRESENCE_CACHE_TTL = 300  # seconds
 
 # Attributes
 ATTR_OVERTIME = "overtime"
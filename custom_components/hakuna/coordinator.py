@@ -1,18 +1,40 @@
 """Data update coordinator for Hakuna."""
 from __future__ import annotations
 
+import asyncio
 import logging
+import time
+from collections.abc import Callable
 from datetime import timedelta
 from typing import Any
 
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
 from .api import HakunaApiClient, HakunaApiError, HakunaAuthError
+from .const import PRESENCE_CACHE_TTL, TASKS_CACHE_TTL
 
 _LOGGER = logging.getLogger(__name__)
 
 
+def _find_default_task_id(tasks: list[dict[str, Any]]) -> int | None:
+    """Return the id of the default task, or the first non-archived one."""
+    default_task_id = None
+    fallback_id = None
+    for task in tasks:
+        if task.get("archived"):
+            continue
+        task_id = task.get("id")
+        if task.get("default"):
+            default_task_id = task_id
+            break
+        if fallback_id is None:
+            fallback_id = task_id
+    if default_task_id is None:
+        default_task_id = fallback_id
+    return default_task_id
+
+
 class HakunaDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
     """Class to manage fetching Hakuna data."""
 
@@ -28,64 +50,145 @@ class HakunaDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             _LOGGER,
             name="Hakuna",
             update_interval=update_interval,
+            # Skip listener callbacks when the fetched data is unchanged
+            always_update=False,
         )
         self.api_client = api_client
+        # The task catalog rarely changes, so it is only refetched hourly
+        self._tasks_cache: list[dict[str, Any]] | None = None
+        self._tasks_cache_ts: float = 0.0
+        self._default_task_id: int | None = None
+        # Presence is only fetched while team member entities use it
+        self._presence_cache: list[dict[str, Any]] | None = None
+        self._presence_cache_ts: float = 0.0
+        self._presence_consumers = 0
+
+    async def async_get_presence(self) -> list[dict[str, Any]]:
+        """Return today's presence, refetching it once it is stale.
+
+        Used for the setup-time lookup of team members.
+        """
+        if (
+            self._presence_cache is not None
+            and time.monotonic() - self._presence_cache_ts < PRESENCE_CACHE_TTL
+        ):
+            return self._presence_cache
+
+        presence = await self.api_client.get_presence()
+        self._presence_cache = presence
+        self._presence_cache_ts = time.monotonic()
+        return presence
+
+    @callback
+    def async_add_presence_consumer(self) -> Callable[[], None]:
+        """Register an entity that reads presence data.
+
+        Returns a callback that unregisters it again.
+        """
+        self._presence_consumers += 1
+        if self._presence_consumers == 1:
+            # Presence was not part of the last update, fetch it now
+            self.hass.async_create_task(self.async_request_refresh())
+
+        @callback
+        def _remove() -> None:
+            self._presence_consumers -= 1
+
+        return _remove
+
+    async def _async_get_presence_if_used(self) -> list[dict[str, Any]]:
+        """Return presence data if any entity consumes it.
+
+        Always fetched fresh so team member sensors follow the scan interval.
+        Presence is optional, so API errors yield an empty list.
+        """
+        if not self._presence_consumers:
+            return []
+        try:
+            presence = await self.api_client.get_presence()
+        except HakunaApiError:
+            return []
+        self._presence_cache = presence
+        self._presence_cache_ts = time.monotonic()
+        return presence
+
+    async def _async_get_tasks(self) -> list[dict[str, Any]]:
+        """Return the cached task list, refetching it once it is stale.
+
+        Tasks are optional, so API errors yield the stale list, if any.
+        """
+        if (
+            self._tasks_cache is not None
+            and time.monotonic() - self._tasks_cache_ts < TASKS_CACHE_TTL
+        ):
+            return self._tasks_cache
+
+        try:
+            tasks = await self.api_client.get_tasks()
+        except HakunaAuthError:
+            self._tasks_cache = None
+            return []
+        except HakunaApiError:
+            # Keep using a stale task list rather than none at all
+            return self._tasks_cache or []
+
+        self._tasks_cache = tasks
+        self._tasks_cache_ts = time.monotonic()
+        self._default_task_id = _find_default_task_id(tasks)
+        return tasks
 
     async def _async_update_data(self) -> dict[str, Any]:
         """Fetch data from Hakuna API."""
-        try:
-            # Get timer status
-            timer = await self.api_client.get_timer()
-
-            # Get overview (overtime, vacation)
-            overview = await self.api_client.get_overview()
-
-            # Get presence info (for team status if available)
-            try:
-                presence = await self.api_client.get_presence()
-            except HakunaApiError:
-                presence = []
-
-            # Get managed users (if supervisor/admin)
-            try:
-                users = await self.api_client.get_users()
-            except HakunaApiError:
-                users = []
-
-            # Get tasks (needed for timer start)
-            try:
-                tasks = await self.api_client.get_tasks()
-            except HakunaApiError:
-                tasks = []
-
-            # Find default task
-            default_task_id = None
-            for task in tasks:
-                if task.get("default") and not task.get("archived"):
-                    default_task_id = task.get("id")
-                    break
-            # Fallback to first non-archived task
-            if default_task_id is None and tasks:
-                for task in tasks:
-                    if not task.get("archived"):
-                        default_task_id = task.get("id")
-                        break
-
-            # Get absence for today
-            absence_today = await self.api_client.get_absences_today()
-
-            return {
-                "timer": timer,
-                "overview": overview,
-                "presence": presence,
-                "users": users,
-                "tasks": tasks,
-                "default_task_id": default_task_id,
-                "timer_running": timer is not None,
-                "absence_today": absence_today,
-            }
-
-        except HakunaAuthError as err:
-            raise UpdateFailed(f"Authentication failed: {err}") from err
-        except HakunaApiError as err:
-            raise UpdateFailed(f"Error fetching data: {err}") from err
+        # All calls are independent, so run them concurrently
+        (
+            timer,
+            overview,
+            presence,
+            tasks,
+            absence_today,
+        ) = await asyncio.gather(
+            # Timer status
+            self.api_client.get_timer(),
+            # Overview (overtime, vacation)
+            self.api_client.get_overview(),
+            # Presence info (for team member sensors, if any are in use)
+            self._async_get_presence_if_used(),
+            # Tasks (needed for timer start)
+            self._async_get_tasks(),
+            # Absence for today
+            self.api_client.get_absences_today(),
+            return_exceptions=True,
+        )
+
+        # Required data: any failure fails the update
+        for result in (timer, overview, absence_today):
+            if isinstance(result, HakunaAuthError):
+                self._tasks_cache = None
+                raise UpdateFailed(f"Authentication failed: {result}") from result
+            if isinstance(result, HakunaApiError):
+                raise UpdateFailed(f"Error fetching data: {result}") from result
+            if isinstance(result, BaseException):
+                raise result
+
+        # Optional data already falls back on API errors in its helpers
+        for result in (presence, tasks):
+            if isinstance(result, BaseException):
+                raise result
+
+        # Index presence by user id so entities can look members up directly
+        presence_by_user_id = {
+            member["user"]["id"]: member
+            for member in presence
+            if (member.get("user") or {}).get("id") is not None
+        }
+
+        return {
+            "timer": timer,
+            "overview": overview,
+            "presence": presence,
+            "presence_by_user_id": presence_by_user_id,
+            "tasks": tasks,
+            "default_task_id": self._default_task_id if tasks else None,
+            "timer_running": timer is not None,
+            "absence_today": absence_today,
+        }
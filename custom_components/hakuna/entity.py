@@ -0,0 +1,53 @@
+"""Shared entity helpers for Hakuna integration."""
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import Any
+
+from homeassistant.helpers.entity import DeviceInfo
+
+from .const import DOMAIN
+
+# Shared empty default for reads of missing data; never mutated
+EMPTY_DICT: dict[str, Any] = {}
+
+
+@lru_cache(maxsize=None)
+def get_device_info(entry_id: str) -> DeviceInfo:
+    """Return the device info shared by all entities of a config entry."""
+    return DeviceInfo(
+        identifiers={(DOMAIN, entry_id)},
+        name="Hakuna",
+        manufacturer="Hakuna AG",
+        model="Time Tracking",
+        entry_type="service",
+    )
+
+
+class CachedAttributesMixin:
+    """Rebuild extra attributes only when the coordinator publishes new data.
+
+    Subclasses implement _build_extra_state_attributes().
+    """
+
+    _attrs_cache_data: dict[str, Any] | None = None
+    _attrs_cache: dict[str, Any] | None = None
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return extra attributes."""
+        data = self.coordinator.data
+        if self._attrs_cache is None or data is not self._attrs_cache_data:
+            self._attrs_cache = self._build_extra_state_attributes()
+            self._attrs_cache_data = data
+        return self._attrs_cache
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Drop cached attributes when the entity is removed."""
+        await super().async_will_remove_from_hass()
+        self._attrs_cache_data = None
+        self._attrs_cache = None
+
+    def _build_extra_state_attributes(self) -> dict[str, Any]:
+        """Build extra attributes from the current coordinator data."""
+        raise NotImplementedError
@@ -1,7 +1,9 @@
 """Sensor entities for Hakuna integration."""
 from __future__ import annotations
 
-from datetime import datetime
+from collections.abc import Callable
+from datetime import datetime, tzinfo
+from functools import lru_cache
 from typing import Any
 
 from homeassistant.components.sensor import (
@@ -13,13 +15,13 @@ from homeassistant.components.sensor import (
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import UnitOfTime
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from homeassistant.util import dt as dt_util
 
 from .const import DOMAIN
 from .coordinator import HakunaDataUpdateCoordinator
+from .entity import EMPTY_DICT, get_device_info
 
 
 SENSOR_DESCRIPTIONS = [
@@ -87,6 +89,91 @@ SENSOR_DESCRIPTIONS = [
 ]
 
 
+def _timer_start_time(data: dict[str, Any]) -> datetime | None:
+    """Return the timer start as a timezone-aware datetime."""
+    timer = data.get("timer")
+    if not timer:
+        return None
+    date_str = timer.get("date")
+    time_str = timer.get("start_time")
+    if not (date_str and time_str):
+        return None
+    return _parse_start_time(date_str, time_str, dt_util.get_default_time_zone())
+
+
+@lru_cache(maxsize=8)
+def _parse_start_time(date_str: str, time_str: str, tz: tzinfo) -> datetime | None:
+    """Parse the timer start, memoized since it only changes per timer session."""
+    # Fixed "YYYY-MM-DD" / "H:MM" format, sliced directly instead of strptime
+    hour, sep, minute = time_str.partition(":")
+    if (
+        len(date_str) != 10
+        or date_str[4] != "-"
+        or date_str[7] != "-"
+        or not (date_str[0:4] + date_str[5:7] + date_str[8:10]).isdigit()
+        or not sep
+        or not 1 <= len(hour) <= 2
+        or not 1 <= len(minute) <= 2
+        or not (hour + minute).isdigit()
+    ):
+        return None
+    try:
+        dt = datetime(
+            int(date_str[0:4]),
+            int(date_str[5:7]),
+            int(date_str[8:10]),
+            int(hour),
+            int(minute),
+            tzinfo=tz,
+        )
+    except ValueError:
+        return None
+    # Make timezone-aware using Home Assistant's configured timezone
+    return dt_util.as_local(dt)
+
+
+def _timer_project(data: dict[str, Any]) -> str | None:
+    """Return the name of the timer's project."""
+    timer = data.get("timer")
+    if timer and timer.get("project"):
+        project = timer["project"]
+        if isinstance(project, dict):
+            return project.get("name")
+        return str(project)
+    return None
+
+
+def _timer_task(data: dict[str, Any]) -> str | None:
+    """Return the name of the timer's task."""
+    timer = data.get("timer")
+    if timer and timer.get("task"):
+        return timer["task"].get("name")
+    return None
+
+
+def _no_value(data: dict[str, Any]) -> None:
+    """Return no value for unknown sensor keys."""
+    return None
+
+
+# Value lookup per sensor key, resolved once per entity
+_VALUE_EXTRACTORS: dict[str, Callable[[dict[str, Any]], Any]] = {
+    "overtime": lambda d: (d.get("overview") or EMPTY_DICT).get("overtime"),
+    "overtime_seconds": lambda d: (d.get("overview") or EMPTY_DICT).get("overtime_in_seconds"),
+    "vacation_remaining": lambda d: (
+        (d.get("overview") or EMPTY_DICT).get("vacation") or EMPTY_DICT
+    ).get("remaining_days"),
+    "vacation_redeemed": lambda d: (
+        (d.get("overview") or EMPTY_DICT).get("vacation") or EMPTY_DICT
+    ).get("redeemed_days"),
+    "timer_duration": lambda d: (d.get("timer") or EMPTY_DICT).get("duration"),
+    "timer_duration_seconds": lambda d: (d.get("timer") or EMPTY_DICT).get("duration_in_seconds"),
+    "timer_start_time": _timer_start_time,
+    "timer_project": _timer_project,
+    "timer_task": _timer_task,
+}
+
+
 async def async_setup_entry(
     hass: HomeAssistant,
     entry: ConfigEntry,
@@ -117,14 +204,11 @@ class HakunaSensor(CoordinatorEntity[HakunaDataUpdateCoordinator], SensorEntity)
         """Initialize the sensor."""
         super().__init__(coordinator)
         self.entity_description = description
+        self._extract = _VALUE_EXTRACTORS.get(description.key, _no_value)
+        # Only the timer duration sensor carries extra attributes
+        self._has_attrs = description.key == "timer_duration"
         self._attr_unique_id = f"{entry.entry_id}_{description.key}"
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, entry.entry_id)},
-            name="Hakuna",
-            manufacturer="Hakuna AG",
-            model="Time Tracking",
-            entry_type="service",
-        )
+        self._attr_device_info = get_device_info(entry.entry_id)
 
     @property
     def native_value(self) -> Any:
@@ -132,87 +216,25 @@ class HakunaSensor(CoordinatorEntity[HakunaDataUpdateCoordinator], SensorEntity)
         if self.coordinator.data is None:
             return None
 
-        key = self.entity_description.key
-        data = self.coordinator.data
-        overview = data.get("overview", {})
-        timer = data.get("timer")
-        presence = data.get("presence", [])
-
-        if key == "overtime":
-            return overview.get("overtime")
-        elif key == "overtime_seconds":
-            return overview.get("overtime_in_seconds")
-        elif key == "vacation_remaining":
-            vacation = overview.get("vacation", {})
-            return vacation.get("remaining_days")
-        elif key == "vacation_redeemed":
-            vacation = overview.get("vacation", {})
-            return vacation.get("redeemed_days")
-        elif key == "timer_duration":
-            if timer:
-                return timer.get("duration")
-            return None
-        elif key == "timer_duration_seconds":
-            if timer:
-                return timer.get("duration_in_seconds")
-            return None
-        elif key == "timer_start_time":
-            if timer:
-                date_str = timer.get("date")
-                time_str = timer.get("start_time")
-                if date_str and time_str:
-                    try:
-                        dt = datetime.strptime(f"{date_str} {time_str}", "%Y-%m-%d %H:%M")
-                        # Make timezone-aware using Home Assistant's configured timezone
-                        return dt_util.as_local(dt.replace(tzinfo=dt_util.get_default_time_zone()))
-                    except ValueError:
-                        return None
-            return None
-        elif key == "timer_project":
-            if timer and timer.get("project"):
-                project = timer["project"]
-                if isinstance(project, dict):
-                    return project.get("name")
-                return str(project)
-            return None
-        elif key == "timer_task":
-            if timer and timer.get("task"):
-                return timer["task"].get("name")
-            return None
-
-        return None
+        return self._extract(self.coordinator.data)
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return extra attributes."""
-        attrs = {}
-        key = self.entity_description.key
-        data = self.coordinator.data
+        if not self._has_attrs:
+            return EMPTY_DICT
 
+        data = self.coordinator.data
         if data is None:
-            return attrs
+            return EMPTY_DICT
 
         timer = data.get("timer")
+        if not timer:
+            return EMPTY_DICT
 
-        if key == "timer_duration" and timer:
-            attrs["note"] = timer.get("note")
-            if timer.get("user"):
-                attrs["user_name"] = timer["user"].get("name")
-                attrs["user_id"] = timer["user"].get("id")
-
-        elif key == "team_present_count":
-            presence = data.get("presence", [])
-            present_users = [
-                p["user"]["name"] for p in presence 
-                if p.get("has_timer_running") and p.get("user")
-            ]
-            absent_users = [
-                p["user"]["name"] for p in presence
-                if (p.get("absent_first_half_day") or p.get("absent_second_half_day"))
-                and p.get("user")
-            ]
-            attrs["present_users"] = present_users
-            attrs["absent_users"] = absent_users
-            attrs["total_users"] = len(presence)
+        attrs = {"note": timer.get("note")}
+        if timer.get("user"):
+            attrs["user_name"] = timer["user"].get("name")
+            attrs["user_id"] = timer["user"].get("id")
 
         return attrs